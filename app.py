@@ -4,6 +4,8 @@ import joblib
 import spacy
 import sys
 import nltk
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 st.set_page_config(page_title="Resume Parser & Job Classifier with ATS Score", layout="wide")
 
@@ -50,16 +52,26 @@ def load_spacy_model():
 
 nlp = load_spacy_model()
 
-from utils import extract_text, preprocess
+from utils import extract_text, preprocess, lemmatizer
 from parser_functions import (
     extract_name, extract_email, extract_phone, extract_skills,
     extract_sections, get_achievements_projects, extract_cpi
 )
 from ml_model import classify_job, calculate_ats_score
+from screening import screen_resume
 
-try:
+BATCH_MAX_WORKERS = 4
+
+@st.cache_resource
+def load_models():
     model = joblib.load('logistic_regression_model.pkl')
     vectorizer = joblib.load('tfidf_vectorizer.pkl')
+    # WordNet loads lazily on first use and that load is not thread-safe, so force it before batch workers start.
+    lemmatizer.lemmatize("resumes")
+    return model, vectorizer
+
+try:
+    model, vectorizer = load_models()
 except FileNotFoundError:
     st.error("Model or vectorizer files not found. Please ensure 'logistic_regression_model.pkl' and 'tfidf_vectorizer.pkl' are in the same directory as the script.")
     st.info("You'll need to train your machine learning model and save these files first. Refer to the project documentation for training instructions.")
@@ -240,14 +252,21 @@ st.markdown("Upload your resume and paste a job description to extract details,
 
 st.markdown("---")
 
+mode = st.radio("Processing Mode", ["Single Resume", "Batch Screening"], horizontal=True,
+                help="Batch Screening ranks several resumes against one job description.")
+
 col1, col2 = st.columns(2)
 
 with col1:
     st.header("Resume Upload")
-    file = st.file_uploader("Upload Resume File", type=["pdf", "docx", "txt"])
-    if st.session_state.get('processed_file', None) is not None:
+    if mode == "Batch Screening":
+        files = st.file_uploader("Upload Resume Files", type=["pdf", "docx", "txt"], accept_multiple_files=True)
+    else:
+        file = st.file_uploader("Upload Resume File", type=["pdf", "docx", "txt"])
+    if st.session_state.get('processed_file', None) is not None or st.session_state.get('batch_results'):
         if st.button("Clear Processed Data", key="clear_data"):
             st.session_state['processed_file'] = None
+            st.session_state['batch_results'] = None
             st.rerun()
 
 with col2:
@@ -269,7 +288,56 @@ def generate_summary_html(name, email, phone, skills, cpi, projects):
     """
     return summary
 
-if st.button("Process Resume & Calculate ATS Score", key="process_button"):
+def batch_inputs_key(files, job_description):
+    digest = hashlib.sha256(job_description.encode('utf-8'))
+    for f in files or []:
+        digest.update(f"\0{f.file_id}".encode('utf-8'))
+    return digest.hexdigest()
+
+def render_ranking(placeholder, rows):
+    ranked = sorted(rows, key=lambda r: (r["ATS Score"] is None, -(r["ATS Score"] or 0), r["File"]))
+    placeholder.dataframe(ranked, use_container_width=True, hide_index=True,
+                          column_config={
+                              "ATS Score": st.column_config.NumberColumn("ATS Score", format="%.2f%%"),
+                              "Confidence": st.column_config.NumberColumn("Confidence", format="%.2f%%"),
+                          })
+
+if mode == "Batch Screening":
+    if st.button("Screen Resumes & Rank by ATS Score", key="batch_process_button"):
+        if not files:
+            st.warning("Please upload one or more resume files to screen.")
+        else:
+            if not job_description:
+                st.info("Paste a Job Description to rank resumes by ATS Match Score.")
+            st.markdown("---")
+            st.header("Candidate Ranking")
+            progress = st.progress(0.0, text=f"Screening 0 of {len(files)} resumes...")
+            table = st.empty()
+            rows = []
+            executor = ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(files)))
+            try:
+                futures = [executor.submit(screen_resume, f, job_description, model, vectorizer) for f in files]
+                for future in as_completed(futures):
+                    rows.append(future.result())
+                    progress.progress(len(rows) / len(files), text=f"Screening {len(rows)} of {len(files)} resumes...")
+                    render_ranking(table, rows)
+            finally:
+                # A rerun or stop interrupts the loop above; drop queued resumes instead of waiting on them.
+                executor.shutdown(wait=False, cancel_futures=True)
+            failed = sum(1 for r in rows if r["Status"] != "OK")
+            progress.progress(1.0, text=f"Screened {len(rows)} resumes ({failed} failed).")
+            st.session_state['batch_results'] = rows
+            st.session_state['batch_inputs_key'] = batch_inputs_key(files, job_description)
+    elif st.session_state.get('batch_results'):
+        if st.session_state.get('batch_inputs_key') != batch_inputs_key(files, job_description):
+            st.session_state['batch_results'] = None
+            st.info("The resumes or job description changed since the last screening. Click the button above to rank them again.")
+        else:
+            st.markdown("---")
+            st.header("Candidate Ranking")
+            render_ranking(st.empty(), st.session_state['batch_results'])
+
+elif st.button("Process Resume & Calculate ATS Score", key="process_button"):
     if file is None:
         st.warning("Please upload a resume file to process.")
     else:
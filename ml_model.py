@@ -1,34 +1,153 @@
+import threading
+import weakref
+import numpy as np
+import scipy.sparse as sp
 from sklearn.metrics.pairwise import cosine_similarity
-from utils import preprocess
+from utils import normalize_word, split_words
+
+_MISSING = object()
+_WORD_CACHE_SIZE = 50000
+
+class TfidfFeaturizer:
+    """Turns raw text into TF-IDF rows using a fitted TfidfVectorizer's vocabulary and idf.
+
+    Gives the same result as vectorizer.transform([preprocess(text)]) without building the
+    joined string or re-tokenizing it. Words go through the same split_words() and
+    normalize_word() helpers as preprocess(). Normalization and vocabulary lookup are
+    memoized per raw word, so repeated words cost a dict lookup. The memo is cleared
+    once it holds _WORD_CACHE_SIZE words so junk tokens cannot pile up forever.
+    """
+
+    def __init__(self, vectorizer):
+        if vectorizer.analyzer != 'word' or tuple(vectorizer.ngram_range) != (1, 1):
+            raise ValueError("TfidfFeaturizer only supports word unigram vectorizers.")
+
+        self.vocabulary = vectorizer.vocabulary_
+        self.n_features = len(self.vocabulary)
+        self.idf = vectorizer.idf_ if vectorizer.use_idf else None
+        self.norm = vectorizer.norm
+        self.binary = vectorizer.binary
+        self.sublinear_tf = vectorizer.sublinear_tf
+        self.dtype = np.float32 if vectorizer.dtype == np.float32 else np.float64
+
+        self._vectorizer_preprocessor = vectorizer.build_preprocessor()
+        self._vectorizer_tokenizer = vectorizer.build_tokenizer()
+        self._vectorizer_stop_words = vectorizer.get_stop_words() or frozenset()
+        self._word_cache = {}
+
+    def _word_columns(self, word):
+        # None means preprocess() drops the word; an empty tuple means it is kept but out of vocabulary.
+        columns = self._word_cache.get(word, _MISSING)
+        if columns is _MISSING:
+            columns = None
+            lemma = normalize_word(word)
+            if lemma is not None:
+                lemma = self._vectorizer_preprocessor(lemma)
+                columns = tuple(self.vocabulary[tok] for tok in self._vectorizer_tokenizer(lemma)
+                                if tok not in self._vectorizer_stop_words and tok in self.vocabulary)
+            if len(self._word_cache) >= _WORD_CACHE_SIZE:
+                self._word_cache.clear()
+            self._word_cache[word] = columns
+        return columns
+
+    def count_terms(self, text):
+        """Returns ({column: term count}, number of words preprocess() would keep)."""
+        counts = {}
+        n_terms = 0
+        for word in split_words(text):
+            columns = self._word_columns(word)
+            if columns is None:
+                continue
+            n_terms += 1
+            for col in columns:
+                counts[col] = counts.get(col, 0) + 1
+        return counts, n_terms
+
+    def _weights(self, counts):
+        columns = np.array(sorted(counts), dtype=np.int32)
+        data = np.array([counts[col] for col in columns], dtype=np.float64)
+        if len(columns) == 0:
+            return columns, data
+
+        if self.binary:
+            data[:] = 1.0
+        if self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1.0
+        if self.idf is not None:
+            data *= self.idf[columns]
+
+        if self.norm == 'l2':
+            scale = np.sqrt(np.dot(data, data))
+        elif self.norm == 'l1':
+            scale = np.abs(data).sum()
+        elif self.norm == 'max':
+            scale = np.abs(data).max()
+        else:
+            scale = 0.0
+        if scale > 0:
+            data /= scale
+        return columns, data
+
+    def matrix_from_counts(self, counts_list):
+        indptr = [0]
+        indices = []
+        data = []
+        for counts in counts_list:
+            columns, weights = self._weights(counts)
+            indices.append(columns)
+            data.append(weights)
+            indptr.append(indptr[-1] + len(columns))
+
+        indices = np.concatenate(indices) if indices else np.array([], dtype=np.int32)
+        data = np.concatenate(data).astype(self.dtype, copy=False) if data else np.array([], dtype=self.dtype)
+        return sp.csr_matrix((data, indices, np.array(indptr, dtype=np.int32)),
+                             shape=(len(indptr) - 1, self.n_features))
+
+    def transform(self, texts):
+        """Builds a CSR matrix with one TF-IDF row per raw text."""
+        return self.matrix_from_counts([self.count_terms(text)[0] for text in texts])
+
+_featurizers = weakref.WeakKeyDictionary()
+_featurizers_lock = threading.Lock()
+
+def get_featurizer(vectorizer):
+    with _featurizers_lock:
+        featurizer = _featurizers.get(vectorizer)
+        if featurizer is None:
+            featurizer = TfidfFeaturizer(vectorizer)
+            _featurizers[vectorizer] = featurizer
+    return featurizer
 
 def classify_job(text, model, vectorizer):
-    clean_text = preprocess(text)
-    if not clean_text.strip():
+    featurizer = get_featurizer(vectorizer)
+    counts, n_terms = featurizer.count_terms(text)
+    if not n_terms:
         return "Unknown", 0.0
 
-    features = vectorizer.transform([clean_text])
+    features = featurizer.matrix_from_counts([counts])
     pred = model.predict(features)[0]
     prob = model.predict_proba(features)[0]
-    
+
     predicted_class_idx = model.classes_.tolist().index(pred)
     confidence = prob[predicted_class_idx]
-    
+
     return pred, confidence
 
 def calculate_ats_score(resume_text, job_description_text, vectorizer):
     if not resume_text or not job_description_text:
         return 0.0
 
-    processed_resume = preprocess(resume_text)
-    processed_jd = preprocess(job_description_text)
-    
-    if not processed_resume or not processed_jd:
+    featurizer = get_featurizer(vectorizer)
+    resume_counts, resume_terms = featurizer.count_terms(resume_text)
+    jd_counts, jd_terms = featurizer.count_terms(job_description_text)
+
+    if not resume_terms or not jd_terms:
         return 0.0
 
-    resume_vector = vectorizer.transform([processed_resume])
-    jd_vector = vectorizer.transform([processed_jd])
+    vectors = featurizer.matrix_from_counts([resume_counts, jd_counts])
 
-    similarity = cosine_similarity(resume_vector, jd_vector)[0][0]
+    similarity = cosine_similarity(vectors[0], vectors[1])[0][0]
 
     ats_score = similarity * 100
-    return round(ats_score, 2)
\ No newline at end of file
+    return round(ats_score, 2)
@@ -1,4 +1,5 @@
 import re
+import threading
 import phonenumbers
 import spacy
 from collections import Counter
@@ -9,6 +10,10 @@ try:
 except OSError:
     print("spaCy model 'en_core_web_sm' not found. Please run: python -m spacy download en_core_web_sm")
     nlp = None 
+
+# spaCy does not guarantee a Language object is safe to call from several threads at once.
+nlp_lock = threading.Lock()
+
 SKILLS = ['python', 'c++', 'java', 'flask', 'streamlit', 'pandas', 'numpy',
           'scikit-learn', 'html', 'css', 'git', 'github', 'linux', 'windows',
           'oop', 'jupyter', 'machine learning', 'data analysis', 'sql', 'tableau',
@@ -26,7 +31,8 @@ def extract_name(text):
                 return line.title()
 
     if nlp: 
-        doc = nlp(text)
+        with nlp_lock:
+            doc = nlp(text)
         potential_names = []
         for ent in doc.ents:
             if ent.label_ == "PERSON":
@@ -0,0 +1,28 @@
+from utils import read_text
+from parser_functions import extract_name, extract_email, extract_phone, extract_skills
+from ml_model import classify_job, calculate_ats_score
+
+def screen_resume(file, job_description, model, vectorizer):
+    # Runs in a batch worker thread, so it must not call st.*; failures are reported through the row.
+    row = {"File": file.name, "Name": None, "Email": None, "Phone": None, "Predicted Job Role": None,
+           "Confidence": None, "ATS Score": None, "Skills": None, "Status": "OK"}
+    try:
+        text = read_text(file)
+
+        if not text:
+            row["Status"] = "No text found in file"
+            return row
+
+        job, conf = classify_job(text, model, vectorizer)
+        row.update({
+            "Name": extract_name(text),
+            "Email": extract_email(text),
+            "Phone": extract_phone(text),
+            "Predicted Job Role": job,
+            "Confidence": round(float(conf) * 100, 2),
+            "ATS Score": calculate_ats_score(text, job_description, vectorizer) if job_description else None,
+            "Skills": ', '.join(extract_skills(text)),
+        })
+    except Exception as e:
+        row["Status"] = f"Error: {e}"
+    return row
@@ -0,0 +1,38 @@
+import csv
+import io
+import os
+import sys
+
+import joblib
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+class FakeUpload(io.BytesIO):
+    """Stands in for Streamlit's UploadedFile in tests."""
+
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+        self.file_id = f"test-{name}"
+
+
+@pytest.fixture(scope="session")
+def vectorizer():
+    return joblib.load(os.path.join(REPO_ROOT, 'tfidf_vectorizer.pkl'))
+
+
+@pytest.fixture(scope="session")
+def model():
+    return joblib.load(os.path.join(REPO_ROOT, 'logistic_regression_model.pkl'))
+
+
+@pytest.fixture(scope="session")
+def resume_texts():
+    csv.field_size_limit(sys.maxsize)
+    with open(os.path.join(REPO_ROOT, 'Dataset_Resume.csv'), encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    return [row['Resume'] for row in rows[::10]]
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from sklearn.metrics.pairwise import cosine_similarity
+
+from ml_model import TfidfFeaturizer, calculate_ats_score, classify_job, get_featurizer
+from utils import preprocess
+
+EDGE_CASES = [
+    "",
+    "   \n\t  ",
+    "the and of is in to a",
+    "a b c d x y z 1 2 3",
+    "us as is",
+    "Naïve Bayes, café résumé, Zürich, 数据 科学, ÉCOLE",
+    "C++ node.js vue.js scikit-learn C# .NET power-bi",
+    "Python python PYTHON; SQL!!! machine_learning data__science",
+    "john.doe@example.com +91-98765-43210 2019-2023 CGPA: 8.7/10",
+]
+
+
+def old_classify_job(text, model, vectorizer):
+    clean_text = preprocess(text)
+    if not clean_text.strip():
+        return "Unknown", 0.0
+    features = vectorizer.transform([clean_text])
+    pred = model.predict(features)[0]
+    prob = model.predict_proba(features)[0]
+    return pred, prob[model.classes_.tolist().index(pred)]
+
+
+def old_calculate_ats_score(resume_text, job_description_text, vectorizer):
+    if not resume_text or not job_description_text:
+        return 0.0
+    processed_resume = preprocess(resume_text)
+    processed_jd = preprocess(job_description_text)
+    if not processed_resume or not processed_jd:
+        return 0.0
+    similarity = cosine_similarity(vectorizer.transform([processed_resume]),
+                                   vectorizer.transform([processed_jd]))[0][0]
+    return round(similarity * 100, 2)
+
+
+def assert_same_matrix(actual, expected):
+    assert actual.shape == expected.shape
+    assert actual.dtype == expected.dtype
+    np.testing.assert_allclose(actual.toarray(), expected.toarray(), rtol=0, atol=1e-12)
+
+
+def test_transform_matches_vectorizer_on_dataset(vectorizer, resume_texts):
+    featurizer = TfidfFeaturizer(vectorizer)
+    expected = vectorizer.transform([preprocess(t) for t in resume_texts])
+    assert_same_matrix(featurizer.transform(resume_texts), expected)
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_transform_matches_vectorizer_on_edge_cases(vectorizer, text):
+    featurizer = TfidfFeaturizer(vectorizer)
+    assert_same_matrix(featurizer.transform([text]), vectorizer.transform([preprocess(text)]))
+
+
+def test_transform_batch_matches_single_rows(vectorizer):
+    featurizer = TfidfFeaturizer(vectorizer)
+    batch = featurizer.transform(EDGE_CASES)
+    for i, text in enumerate(EDGE_CASES):
+        assert_same_matrix(batch[i], featurizer.transform([text]))
+
+
+def test_word_cache_is_bounded(vectorizer, monkeypatch):
+    monkeypatch.setattr('ml_model._WORD_CACHE_SIZE', 10)
+    featurizer = TfidfFeaturizer(vectorizer)
+    text = ' '.join(f"word{i}" for i in range(100))
+    featurizer.count_terms(text)
+    assert len(featurizer._word_cache) <= 10
+    assert_same_matrix(featurizer.transform([text]), vectorizer.transform([preprocess(text)]))
+
+
+def test_get_featurizer_reuses_instance(vectorizer):
+    assert get_featurizer(vectorizer) is get_featurizer(vectorizer)
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_classify_job_matches_preprocess_path(model, vectorizer, text):
+    pred, conf = classify_job(text, model, vectorizer)
+    expected_pred, expected_conf = old_classify_job(text, model, vectorizer)
+    assert pred == expected_pred
+    assert conf == pytest.approx(expected_conf, abs=1e-12)
+
+
+def test_classify_job_unknown_for_empty_text(model, vectorizer):
+    assert classify_job("", model, vectorizer) == ("Unknown", 0.0)
+    assert classify_job("the and of", model, vectorizer) == ("Unknown", 0.0)
+
+
+def test_classify_job_matches_preprocess_path_on_dataset(model, vectorizer, resume_texts):
+    for text in resume_texts:
+        pred, conf = classify_job(text, model, vectorizer)
+        expected_pred, expected_conf = old_classify_job(text, model, vectorizer)
+        assert pred == expected_pred
+        assert conf == pytest.approx(expected_conf, abs=1e-12)
+
+
+def test_calculate_ats_score_matches_preprocess_path(vectorizer, resume_texts):
+    job_description = resume_texts[1]
+    for text in resume_texts[:20] + EDGE_CASES:
+        expected = old_calculate_ats_score(text, job_description, vectorizer)
+        assert calculate_ats_score(text, job_description, vectorizer) == expected
+
+
+@pytest.mark.parametrize("resume_text,job_description_text", [
+    ("", "Python developer"),
+    ("Python developer", ""),
+    ("the and of is", "Python developer"),
+    ("Python developer", "a b c"),
+])
+def test_calculate_ats_score_zero_for_empty_input(vectorizer, resume_text, job_description_text):
+    assert calculate_ats_score(resume_text, job_description_text, vectorizer) == 0.0
+    assert old_calculate_ats_score(resume_text, job_description_text, vectorizer) == 0.0
@@ -0,0 +1,49 @@
+import screening
+from conftest import FakeUpload
+
+JOB_DESCRIPTION = "Data scientist with Python, SQL and machine learning experience."
+
+RESUME = b"""Jane Doe
+jane.doe@example.com
++1 555 123 4567
+Skills: Python, SQL, machine learning, pandas, numpy
+"""
+
+
+def test_screen_resume_fills_row(model, vectorizer):
+    row = screening.screen_resume(FakeUpload("jane.txt", RESUME), JOB_DESCRIPTION, model, vectorizer)
+    assert row["Status"] == "OK"
+    assert row["File"] == "jane.txt"
+    assert row["Name"] == "Jane Doe"
+    assert row["Email"] == "jane.doe@example.com"
+    assert row["ATS Score"] > 0
+    assert "python" in row["Skills"]
+
+
+def test_screen_resume_without_job_description_has_no_score(model, vectorizer):
+    row = screening.screen_resume(FakeUpload("jane.txt", RESUME), "", model, vectorizer)
+    assert row["Status"] == "OK"
+    assert row["ATS Score"] is None
+
+
+def test_screen_resume_reports_corrupt_file_in_status(model, vectorizer):
+    row = screening.screen_resume(FakeUpload("broken.txt", b"\xff\xfe\xfa not utf-8"), JOB_DESCRIPTION,
+                                  model, vectorizer)
+    assert row["Status"].startswith("Error:")
+    assert row["ATS Score"] is None
+
+
+def test_screen_resume_reports_empty_file(model, vectorizer):
+    row = screening.screen_resume(FakeUpload("empty.txt", b"   \n"), JOB_DESCRIPTION, model, vectorizer)
+    assert row["Status"] == "No text found in file"
+
+
+class FailingStreamlit:
+    def error(self, message):
+        raise AssertionError("st.error called from screen_resume")
+
+
+def test_screen_resume_does_not_call_streamlit(monkeypatch, model, vectorizer):
+    monkeypatch.setattr("utils.st", FailingStreamlit())
+    row = screening.screen_resume(FakeUpload("broken.docx", b"not a zip"), JOB_DESCRIPTION, model, vectorizer)
+    assert row["Status"].startswith("Error:")
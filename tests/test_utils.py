@@ -0,0 +1,43 @@
+import pytest
+
+import utils
+from conftest import FakeUpload
+
+CORRUPT_FILES = [
+    ("resume.txt", b"\xff\xfe\xfa not utf-8"),
+    ("resume.docx", b"this is not a zip archive"),
+    ("resume.pdf", b"%PDF-1.4 truncated"),
+]
+
+
+class RecordingStreamlit:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+
+def test_read_text_reads_txt():
+    assert utils.read_text(FakeUpload("resume.txt", b"  Jane Doe\nPython developer \n")) == "Jane Doe\nPython developer"
+
+
+@pytest.mark.parametrize("name,data", CORRUPT_FILES)
+def test_read_text_raises_on_corrupt_file(name, data):
+    with pytest.raises(Exception):
+        utils.read_text(FakeUpload(name, data))
+
+
+@pytest.mark.parametrize("name,data", CORRUPT_FILES)
+def test_extract_text_reports_through_streamlit(monkeypatch, name, data):
+    fake_st = RecordingStreamlit()
+    monkeypatch.setattr(utils, "st", fake_st)
+    assert utils.extract_text(FakeUpload(name, data)) == ""
+    assert len(fake_st.errors) == 1
+    assert fake_st.errors[0].startswith(f"Error processing {name}:")
+
+
+def test_preprocess_uses_normalize_word():
+    text = "The C++ developers, and us: a team of node.js engineers!"
+    expected = [utils.normalize_word(w) for w in utils.split_words(text)]
+    assert utils.preprocess(text) == ' '.join(w for w in expected if w is not None)
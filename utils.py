@@ -3,6 +3,7 @@ import docx
 import fitz 
 import re
 import tempfile
+import threading
 import textract
 import nltk
 from nltk.corpus import stopwords
@@ -28,20 +29,23 @@ except LookupError:
 stop_words = set(stopwords.words('english'))
 lemmatizer = WordNetLemmatizer()
 
-def extract_text_from_pdf(pdf_path):
+# PyMuPDF is not thread-safe, so PDF reads are serialized across the whole process.
+pdf_lock = threading.Lock()
+
+def read_pdf_text(pdf_path):
     text = ""
-    try:
+    with pdf_lock:
         doc = fitz.open(pdf_path)
-        for page_num in range(doc.page_count):
-            page = doc.load_page(page_num)
-            text += page.get_text()
-        doc.close()
-    except Exception as e:
-        st.error(f"Error extracting text from PDF: {e}")
-        text = ""
+        try:
+            for page_num in range(doc.page_count):
+                page = doc.load_page(page_num)
+                text += page.get_text()
+        finally:
+            doc.close()
     return text.strip()
 
-def extract_text(file_upload_object):
+def read_text(file_upload_object):
+    # Same as extract_text but raises instead of calling Streamlit, so it is safe in worker threads.
     ext = file_upload_object.name.split('.')[-1].lower()
     
     # Creating a temporary file to save the uploaded content
@@ -51,11 +55,9 @@ def extract_text(file_upload_object):
     temp_file.close()
     temp_path = temp_file.name
 
-    text = ""
-
     try:
         if ext == 'pdf':
-            text = extract_text_from_pdf(temp_path)
+            text = read_pdf_text(temp_path)
             
         elif ext == 'docx':
             doc = docx.Document(temp_path)
@@ -67,21 +69,33 @@ def extract_text(file_upload_object):
 
         else:
             text = textract.process(temp_path).decode('utf-8')
-            
-    except Exception as e:
-        st.error(f"Error processing {ext} file: {e}") 
-        text = ""
     finally:
         if os.path.exists(temp_path):
             os.remove(temp_path)
             
     return text.strip()
 
-def preprocess(text):
+def extract_text(file_upload_object):
+    try:
+        return read_text(file_upload_object)
+    except Exception as e:
+        st.error(f"Error processing {file_upload_object.name}: {e}")
+        return ""
+
+def split_words(text):
     text = text.lower()
     text = re.sub(r'\W+', ' ', text) 
-    words = text.split()
-    return ' '.join([lemmatizer.lemmatize(w) for w in words if w not in stop_words and len(w) > 1])
+    return text.split()
+
+def normalize_word(word):
+    # Returns the lemma preprocess() keeps for a lowercased word, or None if the word is dropped.
+    if word in stop_words or len(word) <= 1:
+        return None
+    return lemmatizer.lemmatize(word)
+
+def preprocess(text):
+    lemmas = [normalize_word(w) for w in split_words(text)]
+    return ' '.join([lemma for lemma in lemmas if lemma is not None])
 
 def summarize_text(text, num_sentences=5):
     if not text.strip():